@@ -1,8 +1,8 @@
 import asyncio
-import json
-from typing import List
+from typing import List, Optional
 
 import aiohttp
+import orjson
 from autogen_core.base import AgentId, MessageContext
 from autogen_core.components import (
     DefaultTopicId,
@@ -29,6 +29,24 @@ from ..data_types import (
 )
 from ..otlp_tracing import logger
 
+# Reused across searches so TCP/TLS connections to Bing and result pages are pooled
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        # No cookie jar, so cookies from one user's search never reach another's
+        _http_session = aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar())
+    return _http_session
+
+
+async def close_http_session() -> None:
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
 
 # Retry logic for Bing search with exponential backoff
 @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
@@ -61,33 +79,33 @@ async def get_info_from_bing_search(
     search_query: Annotated[str, "query to search on Bing for information"]
 ) -> str:
     logger.info(f"Performing Bing search for: {search_query}")
-    async with aiohttp.ClientSession() as session:
-        search_params = {"q": search_query, "count": 6}
-
-        search_results = await _search_custom_bing(
-            session=session, query_params=search_params
-        )
-        urls = [result["url"] for result in search_results["webPages"]["value"]]
-        snippets = [result["snippet"] for result in search_results["webPages"]["value"]]
-
-        # Limit the number of concurrent requests
-        semaphore = asyncio.Semaphore(6)
-
-        # Fetch content with semaphore to limit concurrency
-        async def fetch_with_semaphore(url: str) -> str:
-            async with semaphore:
-                return await _fetch_content(session, url)
-
-        tasks = [fetch_with_semaphore(url) for url in urls]
-        contents = await asyncio.gather(*tasks)
-
-        # Merge URLs, snippets, and contents into a single list of dictionaries
-        merged_results = [
-            {"url": url, "snippet": snippet, "content": content}
-            for url, snippet, content in zip(urls, snippets, contents)
-        ]
-        logger.info(f"Search results: {merged_results}")
-        return json.dumps(merged_results)
+    session = _get_http_session()
+    search_params = {"q": search_query, "count": 6}
+
+    search_results = await _search_custom_bing(
+        session=session, query_params=search_params
+    )
+    urls = [result["url"] for result in search_results["webPages"]["value"]]
+    snippets = [result["snippet"] for result in search_results["webPages"]["value"]]
+
+    # Limit the number of concurrent requests
+    semaphore = asyncio.Semaphore(6)
+
+    # Fetch content with semaphore to limit concurrency
+    async def fetch_with_semaphore(url: str) -> str:
+        async with semaphore:
+            return await _fetch_content(session, url)
+
+    tasks = [fetch_with_semaphore(url) for url in urls]
+    contents = await asyncio.gather(*tasks)
+
+    # Merge URLs, snippets, and contents into a single list of dictionaries
+    merged_results = [
+        {"url": url, "snippet": snippet, "content": content}
+        for url, snippet, content in zip(urls, snippets, contents)
+    ]
+    logger.info(f"Search results: {merged_results}")
+    return orjson.dumps(merged_results).decode()
 
 
 # Utility function to get travel activity tools
@@ -150,7 +168,7 @@ class ActivitiesAgent(RoutedAgent):
                 [UserMessage(content=messages[-1].content, source="ActivitiesAgent")],
                 extra_create_args={"response_format": Activities},
             )
-            return Activities.model_validate(json.loads(response_content.content))
+            return Activities.model_validate_json(response_content.content)
         except Exception as e:
             logger.error(f"Failed to parse activities response: {str(e)}")
             return Activities(destination_city="", activities=[])
@@ -1,4 +1,3 @@
-import json
 from typing import List
 
 from autogen_core.base import MessageContext
@@ -54,8 +53,8 @@ class DestinationAgent(RoutedAgent):
                 ],
                 extra_create_args={"response_format": DestinationInfo},
             )
-            destination_info_structured = DestinationInfo.model_validate(
-                json.loads(response_content.content)
+            destination_info_structured = DestinationInfo.model_validate_json(
+                response_content.content
             )
         except Exception as e:
             logger.error(f"Failed to parse destination response: {str(e)}")
@@ -88,8 +87,8 @@ class DestinationAgent(RoutedAgent):
                 ],
                 extra_create_args={"response_format": DestinationInfo},
             )
-            destination_info_structured = DestinationInfo.model_validate(
-                json.loads(response_content.content)
+            destination_info_structured = DestinationInfo.model_validate_json(
+                response_content.content
             )
         except Exception as e:
             logger.error(f"Failed to parse destination response: {str(e)}")
@@ -1,4 +1,5 @@
 import random
+from datetime import date
 from typing import Dict, List
 
 from autogen_core.base import MessageContext
@@ -22,40 +23,47 @@ from ..data_types import (
 )
 from ..otlp_tracing import logger
 
+_RNG = random.Random()
 
-async def simulate_flight_booking(
+_SIMULATED_RESPONSE_PREFIX = (
+    "Simulated response: Flight booking processed successfully for query - "
+)
+
+_FLIGHT_OPTIONS = (
+    {"airline": "Air France", "flight_number": "AF123", "price_per_ticket": 200},
+    {"airline": "Delta", "flight_number": "DL456", "price_per_ticket": 250},
+    {
+        "airline": "British Airways",
+        "flight_number": "BA789",
+        "price_per_ticket": 300,
+    },
+    {"airline": "Lufthansa", "flight_number": "LH101", "price_per_ticket": 220},
+    {"airline": "Emirates", "flight_number": "EK202", "price_per_ticket": 400},
+)
+
+
+def simulate_flight_booking(
     departure_city: str = "New York",
     destination_city: str = "Paris",
     departure_date: str = "2023-12-20",
     return_date: str = "2023-12-30",
     number_of_passengers: int = 2,
 ) -> FlightBooking:
-    flight_options = [
-        {"airline": "Air France", "flight_number": "AF123", "price_per_ticket": 200},
-        {"airline": "Delta", "flight_number": "DL456", "price_per_ticket": 250},
-        {
-            "airline": "British Airways",
-            "flight_number": "BA789",
-            "price_per_ticket": 300,
-        },
-        {"airline": "Lufthansa", "flight_number": "LH101", "price_per_ticket": 220},
-        {"airline": "Emirates", "flight_number": "EK202", "price_per_ticket": 400},
-    ]
-
-    selected_flight = random.choice(flight_options)
+    selected_flight = _RNG.choice(_FLIGHT_OPTIONS)
     total_price = 2 * selected_flight["price_per_ticket"]
     booking_reference = (
-        f"FL-{random.randint(1000, 9999)}-{destination_city[:3].upper()}"
+        f"FL-{_RNG.randint(1000, 9999)}-{destination_city[:3].upper()}"
     )
 
-    return FlightBooking(
+    # All fields are produced locally, so skip validation and set the exact field types
+    return FlightBooking.model_construct(
         departure_city=departure_city,
         destination_city=destination_city,
-        departure_date=departure_date,
-        return_date=return_date,
+        departure_date=date.fromisoformat(departure_date),
+        return_date=date.fromisoformat(return_date),
         airline=selected_flight["airline"],
         flight_number=selected_flight["flight_number"],
-        total_price=total_price,
+        total_price=float(total_price),
         booking_reference=booking_reference,
         number_of_passengers=number_of_passengers,
     )
@@ -83,7 +91,7 @@ class FlightAgent(RoutedAgent):
     async def handle_message(
         self, message: EndUserMessage, ctx: MessageContext
     ) -> None:
-        logger.info(f"FlightAgent received message: {message.content}")
+        logger.info("FlightAgent received message: %s", message.content)
         if "travel plan" in message.content.lower():
             await self.publish_message(
                 HandoffMessage(content=message.content, source=self.id.type),
@@ -91,12 +99,12 @@ class FlightAgent(RoutedAgent):
             )
             return
 
-        response = await simulate_flight_booking()
+        response = simulate_flight_booking()
         await self.publish_message(
             AgentStructuredResponse(
                 agent_type=self.id.type,
                 data=response,
-                message=f"Simulated response: Flight booking processed successfully for query - {message.content}",
+                message=_SIMULATED_RESPONSE_PREFIX + message.content,
             ),
             DefaultTopicId(type="user_proxy", source=ctx.topic_id.source),
         )
@@ -105,9 +113,11 @@ class FlightAgent(RoutedAgent):
     async def handle_travel_request(
         self, message: TravelRequest, ctx: MessageContext
     ) -> GroupChatMessage:
-        logger.info(f"FlightAgent received travel request sub-task: {message.content}")
+        logger.info(
+            "FlightAgent received travel request sub-task: %s", message.content
+        )
 
-        response = await simulate_flight_booking()
+        response = simulate_flight_booking()
         return GroupChatMessage(
             source=self.id.type,
             content=f"Flight booking processed: {response}",
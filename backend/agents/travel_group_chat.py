@@ -120,15 +120,19 @@ class GroupChatManager(RoutedAgent):
         logger.info(
             "GroupChatManager requesting relevant agents to provide details for the travel plan"
         )
-        for agent_type in relevant_agents:
-            await self.publish_message(
-                TravelRequest(
-                    source="GroupChatManager",
-                    content="Provide details for the travel plan",
-                    original_task="General travel plan",
-                ),
-                DefaultTopicId(type=agent_type, source=self._session_id),
+        await asyncio.gather(
+            *(
+                self.publish_message(
+                    TravelRequest(
+                        source="GroupChatManager",
+                        content="Provide details for the travel plan",
+                        original_task="General travel plan",
+                    ),
+                    DefaultTopicId(type=agent_type, source=self._session_id),
+                )
+                for agent_type in relevant_agents
             )
+        )
 
     @message_handler
     async def handle_handoff(self, message: TravelRequest, ctx: MessageContext) -> None:
@@ -145,7 +149,7 @@ class GroupChatManager(RoutedAgent):
         if message.original_task and "complete" in message.content.lower():
             self._conversation_complete = True
             logger.info("Conversation completed. Clearing session.")
-            # Add cleanup or finalization logic here if needed.
+            self._responses.pop(session_id, None)
         else:
             await self.compile_final_plan()
 
@@ -155,7 +159,7 @@ class GroupChatManager(RoutedAgent):
         """
         logger.info("Compiling final travel plan from collected responses.")
         final_plan = "\n".join(
-            response.content for response in self._responses[self._session_id]
+            response.content for response in self._responses.get(self._session_id, ())
         )
         logger.info(f"Compiled Final Travel Plan: {final_plan}")
         await self.publish_message(
@@ -1,6 +1,6 @@
 import datetime
 import random
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from autogen_core.base import AgentId, MessageContext
 from autogen_core.components import (
@@ -25,6 +25,21 @@ from ..data_types import (
 )
 from ..otlp_tracing import logger
 
+_RNG = random.Random()
+
+# Simulated available hotel options
+_HOTEL_OPTIONS = (
+    {"hotel_name": "Hilton", "room_type": "Deluxe", "price_per_night": 200},
+    {"hotel_name": "Marriott", "room_type": "Standard", "price_per_night": 150},
+    {"hotel_name": "Hyatt", "room_type": "Suite", "price_per_night": 300},
+    {"hotel_name": "Sheraton", "room_type": "Executive", "price_per_night": 250},
+    {"hotel_name": "Holiday Inn", "room_type": "Standard", "price_per_night": 100},
+)
+
+_SYSTEM_MESSAGES: Tuple[LLMMessage, ...] = (
+    SystemMessage("You are a helpful AI assistant that can make hotel booking."),
+)
+
 
 async def create_hotel_booking(
     city: Annotated[str, "The city where the hotel booking will take place."],
@@ -35,43 +50,37 @@ async def create_hotel_booking(
         str, "The check-out date of the hotel booking in the format 'YYYY-MM-DD'."
     ],
 ) -> HotelBooking:
-    # Simulate available hotel options
     logger.info(
-        f"Function call: Creating hotel booking for {city} from {check_in_date} to {check_out_date}"
+        "Function call: Creating hotel booking for %s from %s to %s",
+        city,
+        check_in_date,
+        check_out_date,
     )
-    hotel_options = [
-        {"hotel_name": "Hilton", "room_type": "Deluxe", "price_per_night": 200},
-        {"hotel_name": "Marriott", "room_type": "Standard", "price_per_night": 150},
-        {"hotel_name": "Hyatt", "room_type": "Suite", "price_per_night": 300},
-        {"hotel_name": "Sheraton", "room_type": "Executive", "price_per_night": 250},
-        {"hotel_name": "Holiday Inn", "room_type": "Standard", "price_per_night": 100},
-    ]
-
     # Randomly select a hotel option
-    selected_hotel = random.choice(hotel_options)
+    selected_hotel = _RNG.choice(_HOTEL_OPTIONS)
 
     # Calculate the number of nights
-    check_in = datetime.datetime.strptime(check_in_date, "%Y-%m-%d")
-    check_out = datetime.datetime.strptime(check_out_date, "%Y-%m-%d")
+    check_in = datetime.date.fromisoformat(check_in_date)
+    check_out = datetime.date.fromisoformat(check_out_date)
     num_nights = (check_out - check_in).days
 
     # Calculate total price for the stay
     total_price = num_nights * selected_hotel["price_per_night"]
 
     # Create a booking reference number
-    booking_reference = f"HT-{random.randint(1000, 9999)}-{city[:3].upper()}"
+    booking_reference = f"HT-{_RNG.randint(1000, 9999)}-{city[:3].upper()}"
 
-    hotel_booking_details = HotelBooking(
+    hotel_booking_details = HotelBooking.model_construct(
         city=city,
         check_in_date=check_in_date,
         check_out_date=check_out_date,
         hotel_name=selected_hotel["hotel_name"],
         room_type=selected_hotel["room_type"],
-        total_price=total_price,
+        total_price=float(total_price),
         booking_reference=booking_reference,
     )
 
-    logger.info(f"Hotel booking details: {hotel_booking_details}")
+    logger.info("Hotel booking details: %s", hotel_booking_details)
 
     return hotel_booking_details
 
@@ -95,9 +104,7 @@ class HotelAgent(RoutedAgent):
         tool_agent_type: str,
     ) -> None:
         super().__init__("HotelAgent")
-        self._system_messages: List[LLMMessage] = [
-            SystemMessage("You are a helpful AI assistant that can make hotel booking.")
-        ]
+        self._system_messages = _SYSTEM_MESSAGES
         self._model_client = model_client
         self._tools = tools
         self._tool_agent_id = AgentId(tool_agent_type, self.id.key)
@@ -105,7 +112,8 @@ class HotelAgent(RoutedAgent):
     async def _process_request(self, message_content: str, ctx: MessageContext) -> str:
         # Create a session for the activities agent
         session: List[LLMMessage] = [
-            UserMessage(content=message_content, source="user")
+            *self._system_messages,
+            UserMessage(content=message_content, source="user"),
         ]
         # Run the caller loop
         try:
@@ -117,9 +125,9 @@ class HotelAgent(RoutedAgent):
                 tool_schema=self._tools,
                 cancellation_token=ctx.cancellation_token,
             )
-            logger.info(f"Tool agent caller loop completed: {messages}")
+            logger.info("Tool agent caller loop completed: %s", messages)
         except Exception as e:
-            logger.error(f"Tool agent caller loop failed: {str(e)}")
+            logger.error("Tool agent caller loop failed: %s", e)
             return "Failed to book hotel. Please try again."
 
         # Ensure the final message content is a string
@@ -130,7 +138,9 @@ class HotelAgent(RoutedAgent):
     async def handle_message(
         self, message: EndUserMessage, ctx: MessageContext
     ) -> None:
-        logger.info(f"HotelAgent received message - EndUserMessage: {message.content}")
+        logger.info(
+            "HotelAgent received message - EndUserMessage: %s", message.content
+        )
         if "travel plan" in message.content.lower():
             # Cannot handle complex travel plans, hand off back to router
             await self.publish_message(
@@ -152,7 +162,7 @@ class HotelAgent(RoutedAgent):
             AgentStructuredResponse(
                 agent_type=self.id.type,
                 data=simulated_func_call,
-                message=f"{response_content}",
+                message=response_content,
             ),
             DefaultTopicId(type="user_proxy", source=ctx.topic_id.source),
         )
@@ -162,20 +172,12 @@ class HotelAgent(RoutedAgent):
         self, message: TravelRequest, ctx: MessageContext
     ) -> GroupChatMessage:
         logger.info(
-            f"HotelAgent received travel request - TravelRequest: {message.content}"
+            "HotelAgent received travel request - TravelRequest: %s", message.content
         )
         response_content = await self._process_request(message.content, ctx)
-        logger.info(f"HotelAgent response: {response_content}")
-
-        simulated_func_call = await create_hotel_booking(
-            city="Singapore",
-            check_in_date=datetime.datetime.now().strftime("%Y-%m-%d"),
-            check_out_date=(
-                datetime.datetime.now() + datetime.timedelta(days=5)
-            ).strftime("%Y-%m-%d"),
-        )
+        logger.info("HotelAgent response: %s", response_content)
 
         return GroupChatMessage(
             source=self.id.type,
-            content=f"{response_content}",
+            content=response_content,
         )
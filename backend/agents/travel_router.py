@@ -1,4 +1,3 @@
-import json
 from collections import deque
 
 from autogen_core.base import MessageContext
@@ -8,7 +7,7 @@ from autogen_core.components import (
     message_handler,
     type_subscription,
 )
-from autogen_core.components.models import SystemMessage
+from autogen_core.components.models import SystemMessage, UserMessage
 from autogen_ext.models import AzureOpenAIChatCompletionClient
 
 from ..data_types import (
@@ -149,7 +148,8 @@ class SemanticRouterAgent(RoutedAgent):
             logger.info(
                 f"Getting planner prompt for message: {message.content} and history: {[msg.content for msg in history]}"
             )
-            system_message = agent_registry.get_planner_prompt(
+            system_message = agent_registry.get_planner_system_prompt()
+            planner_prompt = agent_registry.get_planner_prompt(
                 message=message, history=history
             )
             # logger.info(f"System message: {system_message}")
@@ -158,11 +158,14 @@ class SemanticRouterAgent(RoutedAgent):
 
         try:
             response = await self._model_client.create(
-                [SystemMessage(system_message)],
+                [
+                    SystemMessage(system_message),
+                    UserMessage(content=planner_prompt, source="user"),
+                ],
                 extra_create_args={"response_format": TravelPlan},
             )
-            my_travel_plan: TravelPlan = TravelPlan.model_validate(
-                json.loads(response.content)
+            my_travel_plan: TravelPlan = TravelPlan.model_validate_json(
+                response.content
             )
             if my_travel_plan.is_greeting:
                 logger.info("User greeting detected")
@@ -20,6 +20,8 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from starlette.websockets import WebSocketState
 
+from backend.agents.travel_activities import close_http_session
+from backend.config import Config
 from backend.data_types import AgentResponse, EndUserMessage, AgentStructuredResponse
 from backend.otlp_tracing import logger
 from backend.utils import initialize_agent_runtime
@@ -44,6 +46,8 @@ async def lifespan(app: FastAPI):
     yield  # This separates the startup and shutdown logic
 
     # Cleanup logic goes here
+    await close_http_session()
+    await Config.CloseSharedHttpClient()
     agent_runtime = None
     user_proxy_agent_instance = None
 
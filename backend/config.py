@@ -9,6 +9,7 @@ from azure.identity.aio import (
     get_bearer_token_provider,
 )
 from dotenv import load_dotenv
+from openai import DefaultAsyncHttpxClient
 
 from .otlp_tracing import logger
 
@@ -65,6 +66,7 @@ class Config:
     __comos_client = None
     __cosmos_database = None
     __aoai_chatCompletionClient = None
+    __http_client = None
 
     def GetAzureCredentials():
         # If we have specified the credentials in the environment, use them (backwards compatibility)
@@ -98,6 +100,20 @@ class Config:
     def GetTokenProvider(scopes):
         return get_bearer_token_provider(Config.GetAzureCredentials(), scopes)
 
+    # Shared HTTP connection pool for all Azure OpenAI clients, so keep-alive
+    # connections are reused across agents instead of each client opening its own.
+    # DefaultAsyncHttpxClient keeps the openai SDK's timeout, limits and redirects.
+    def GetSharedHttpClient():
+        if Config.__http_client is None:
+            Config.__http_client = DefaultAsyncHttpxClient()
+        return Config.__http_client
+
+    # The cached model clients keep a reference to this client, so it is closed but
+    # not replaced; call only at process shutdown
+    async def CloseSharedHttpClient():
+        if Config.__http_client is not None:
+            await Config.__http_client.aclose()
+
     def GetAzureOpenAIChatCompletionClient(model_capabilities):
         if Config.__aoai_chatCompletionClient is not None:
             return Config.__aoai_chatCompletionClient
@@ -112,6 +128,7 @@ class Config:
                     "https://cognitiveservices.azure.com/.default"
                 ),
                 model_capabilities=model_capabilities,
+                http_client=Config.GetSharedHttpClient(),
             )
         else:
             # Fallback behavior to use API key
@@ -121,6 +138,7 @@ class Config:
                 azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
                 api_key=Config.AZURE_OPENAI_API_KEY,
                 model_capabilities=model_capabilities,
+                http_client=Config.GetSharedHttpClient(),
             )
 
         return Config.__aoai_chatCompletionClient
@@ -44,6 +44,7 @@ class AgentRegistry:
         }
 
         self.agent_tools = self.retrieve_all_agent_tools()
+        self._planner_system_prompt: Optional[str] = None
 
     def retrieve_all_agent_tools(self) -> List[Dict[str, Any]]:
         tools = []
@@ -72,7 +73,11 @@ class AgentRegistry:
         logger.info(f"AgentRegistry: Getting agent for intent: {intent}")
         return self.agents.get(intent)
 
-    def get_planner_prompt(self, message: EndUserMessage, history) -> str:
+    def get_planner_system_prompt(self) -> str:
+        # The agent catalogue never changes after startup, so build the prompt once
+        if self._planner_system_prompt is not None:
+            return self._planner_system_prompt
+
         agent_details = {}
         for agent in self.agents.values():
             agent_details[agent["agent_type"]] = {
@@ -101,19 +106,24 @@ class AgentRegistry:
 
         # logger.info(f"Agent descriptions: {agent_descriptions}")
 
-        planner_prompt = """
+        self._planner_system_prompt = """
     You are an orchestration agent.
     Your job is to decide which agents to run based on the user's request and the conversation history.
     Below are the available agents:
 
     {agent_descriptions}
 
-    The current user message: {message}
-    Conversation history so far: {history}
-
     Your response should only include the selected agent and a brief justification for your choice, without any additional text.
     """.format(
             agent_descriptions=agent_descriptions.strip(),
+        )
+        return self._planner_system_prompt
+
+    def get_planner_prompt(self, message: EndUserMessage, history) -> str:
+        planner_prompt = """
+    Conversation history so far: {history}
+    The current user message: {message}
+    """.format(
             message=message.content,
             history=", ".join(msg.content for msg in history),
         )
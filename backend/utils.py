@@ -35,6 +35,7 @@ llm = AzureOpenAI(
     api_key=Config.AZURE_OPENAI_API_KEY,
     azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
     api_version=Config.AZURE_OPENAI_API_VERSION,
+    async_http_client=Config.GetSharedHttpClient(),
 )
 
 model_capabilities = {